@@ -1,181 +1,222 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 
-np.random.seed(42)
-
-print("Generating datasets...")
+# single seeded generator shared by every dataset
+rng = np.random.default_rng(42)
 
 # Sales data - main dataset
 def generate_sales_data(n=5000):
     
-    start = datetime(2022, 1, 1)
-    dates = [start + timedelta(days=random.randint(0, 1095)) for _ in range(n)]
+    start = np.datetime64('2022-01-01')
+    dates = start + rng.integers(0, 1096, n).astype('timedelta64[D]')
     
-    categories = ['Technology', 'Furniture', 'Office Supplies']
+    categories = np.array(['Technology', 'Furniture', 'Office Supplies'])
     subcats = {
         'Technology': ['Phones', 'Computers', 'Accessories', 'Copiers'],
         'Furniture': ['Chairs', 'Tables', 'Bookcases', 'Furnishings'],
         'Office Supplies': ['Paper', 'Binders', 'Art', 'Storage', 'Labels']
     }
     
-    regions = ['East', 'West', 'Central', 'South']
-    segments = ['Consumer', 'Corporate', 'Home Office']
-    
-    data = []
-    for i in range(n):
-        cat = random.choice(categories)
-        subcat = random.choice(subcats[cat])
-        region = random.choice(regions)
-        segment = random.choice(segments)
-        
-        # pricing logic based on category
-        if cat == 'Technology':
-            price = random.uniform(50, 2000)
-        elif cat == 'Furniture':
-            price = random.uniform(100, 1500)
-        else:
-            price = random.uniform(5, 300)
-        
-        qty = random.randint(1, 10)
-        discount = random.choice([0, 0.1, 0.15, 0.2, 0.25])
-        
-        sales = price * qty * (1 - discount)
-        profit = sales * random.uniform(0.05, 0.35)
-        
-        data.append({
-            'Order_ID': f'ORD-{i+1000}',
-            'Order_Date': dates[i],
-            'Ship_Date': dates[i] + timedelta(days=random.randint(1, 7)),
-            'Category': cat,
-            'Sub_Category': subcat,
-            'Product_Name': f'{subcat} {random.randint(100,999)}',
-            'Sales': round(sales, 2),
-            'Quantity': qty,
-            'Discount': discount,
-            'Profit': round(profit, 2),
-            'Region': region,
-            'Segment': segment,
-            'Customer_ID': f'CUST-{random.randint(1000, 9999)}',
-            'State': random.choice(['California', 'Texas', 'New York', 'Florida', 
-                                   'Illinois', 'Pennsylvania', 'Ohio', 'Georgia'])
-        })
-    
-    return pd.DataFrame(data)
+    regions = np.array(['East', 'West', 'Central', 'South'])
+    segments = np.array(['Consumer', 'Corporate', 'Home Office'])
+    states = np.array(['California', 'Texas', 'New York', 'Florida',
+                       'Illinois', 'Pennsylvania', 'Ohio', 'Georgia'])
+    
+    # padded category x sub-category table so sub-categories can be drawn by index
+    subcat_counts = np.array([len(subcats[c]) for c in categories])
+    subcat_lookup = np.full((len(categories), subcat_counts.max()), '', dtype=object)
+    for row, cat in enumerate(categories):
+        subcat_lookup[row, :subcat_counts[row]] = subcats[cat]
+    
+    cat_idx = rng.integers(0, len(categories), n)
+    cats = categories[cat_idx]
+    subcat = subcat_lookup[cat_idx, rng.integers(0, subcat_counts[cat_idx])].astype(str)
+    region = rng.choice(regions, n)
+    segment = rng.choice(segments, n)
+    
+    # pricing logic based on category
+    u = rng.uniform(0, 1, n)
+    price = np.select(
+        [cats == 'Technology', cats == 'Furniture'],
+        [50 + 1950 * u, 100 + 1400 * u],
+        default=5 + 295 * u
+    )
+    
+    qty = rng.integers(1, 11, n)
+    discount = rng.choice([0, 0.1, 0.15, 0.2, 0.25], n)
+    
+    sales = price * qty * (1 - discount)
+    profit = sales * rng.uniform(0.05, 0.35, n)
+    
+    df = pd.DataFrame({
+        'Order_ID': np.char.add('ORD-', np.arange(1000, 1000 + n).astype(str)),
+        'Order_Date': dates,
+        'Ship_Date': dates + rng.integers(1, 8, n).astype('timedelta64[D]'),
+        'Category': cats,
+        'Sub_Category': subcat,
+        'Product_Name': np.char.add(np.char.add(subcat, ' '), rng.integers(100, 1000, n).astype(str)),
+        'Sales': np.round(sales, 2),
+        'Quantity': qty.astype(np.int8),
+        'Discount': discount.astype(np.float32),
+        'Profit': np.round(profit, 2),
+        'Region': region,
+        'Segment': segment,
+        'Customer_ID': np.char.add('CUST-', rng.integers(1000, 10000, n).astype(str)),
+        'State': rng.choice(states, n)
+    })
+    
+    # low-cardinality labels as categoricals, Parquet keeps the dtype
+    cat_cols = ['Category', 'Sub_Category', 'Region', 'Segment', 'State']
+    df[cat_cols] = df[cat_cols].astype('category')
+    
+    return df
 
 
 # Operations/manufacturing data
 def generate_operations_data(n=2000):
     
     dates = pd.date_range('2023-01-01', '2024-12-31', freq='D')
+    shifts = ['Morning', 'Evening', 'Night']
+    N = len(dates) * len(shifts)
+    
+    production = rng.integers(800, 1201, N)
+    defects = (production * rng.uniform(0.01, 0.05, N)).astype(int)
+    downtime = rng.integers(0, 121, N)  # minutes
+    
+    df = pd.DataFrame({
+        'Date': np.repeat(dates.values, len(shifts)),
+        'Shift': np.tile(shifts, len(dates)),
+        'Units_Produced': production.astype(np.int16),
+        'Defects': defects.astype(np.int16),
+        'Defect_Rate': np.round(defects / production, 4),
+        'Downtime_Minutes': downtime.astype(np.int16),
+        'Efficiency': np.round(rng.uniform(0.75, 0.98, N), 3),
+        'Energy_Used': rng.integers(500, 801, N).astype(np.int16),
+        'Labor_Hours': rng.integers(150, 201, N).astype(np.int16)
+    })
+    
+    df['Shift'] = df['Shift'].astype('category')
     
-    data = []
-    for date in dates:
-        for shift in ['Morning', 'Evening', 'Night']:
-            production = random.randint(800, 1200)
-            defects = int(production * random.uniform(0.01, 0.05))
-            downtime = random.randint(0, 120)  # minutes
-            
-            data.append({
-                'Date': date,
-                'Shift': shift,
-                'Units_Produced': production,
-                'Defects': defects,
-                'Defect_Rate': round(defects/production, 4),
-                'Downtime_Minutes': downtime,
-                'Efficiency': round(random.uniform(0.75, 0.98), 3),
-                'Energy_Used': random.randint(500, 800),
-                'Labor_Hours': random.randint(150, 200)
-            })
-    
-    return pd.DataFrame(data)
+    return df
 
 
 # Financial data
 def generate_financial_data():
     
     months = pd.date_range('2022-01-01', '2024-12-31', freq='MS')
+    n = len(months)
     
-    data = []
     base_revenue = 500000
+    i = np.arange(n)
     
-    for i, month in enumerate(months):
-        # add growth trend and seasonality
-        trend = base_revenue * (1 + 0.015 * i)
-        seasonal = trend * (1 + 0.1 * np.sin(2 * np.pi * i / 12))
-        revenue = seasonal + random.uniform(-20000, 30000)
-        
-        cogs = revenue * random.uniform(0.55, 0.65)
-        opex = revenue * random.uniform(0.20, 0.30)
-        profit = revenue - cogs - opex
-        
-        data.append({
-            'Month': month,
-            'Revenue': round(revenue, 2),
-            'COGS': round(cogs, 2),
-            'Operating_Expenses': round(opex, 2),
-            'Gross_Profit': round(revenue - cogs, 2),
-            'Net_Profit': round(profit, 2),
-            'Budget_Revenue': round(revenue * random.uniform(0.9, 1.1), 2),
-            'Cash_Flow': round(profit * random.uniform(0.8, 1.2), 2)
-        })
-    
-    return pd.DataFrame(data)
+    # add growth trend and seasonality
+    trend = base_revenue * (1 + 0.015 * i)
+    seasonal = trend * (1 + 0.1 * np.sin(2 * np.pi * i / 12))
+    revenue = seasonal + rng.uniform(-20000, 30000, n)
+    
+    cogs = revenue * rng.uniform(0.55, 0.65, n)
+    opex = revenue * rng.uniform(0.20, 0.30, n)
+    profit = revenue - cogs - opex
+    
+    return pd.DataFrame({
+        'Month': months,
+        'Revenue': np.round(revenue, 2),
+        'COGS': np.round(cogs, 2),
+        'Operating_Expenses': np.round(opex, 2),
+        'Gross_Profit': np.round(revenue - cogs, 2),
+        'Net_Profit': np.round(profit, 2),
+        'Budget_Revenue': np.round(revenue * rng.uniform(0.9, 1.1, n), 2),
+        'Cash_Flow': np.round(profit * rng.uniform(0.8, 1.2, n), 2)
+    })
 
 
 # Customer analytics
 def generate_customer_data(n=1500):
     
-    data = []
-    for i in range(n):
-        signup_date = datetime(2020, 1, 1) + timedelta(days=random.randint(0, 1460))
-        purchases = random.randint(1, 50)
-        avg_order = random.uniform(50, 500)
-        lifetime_value = purchases * avg_order
-        
-        # churn logic
-        days_since_last = random.randint(0, 365)
-        churned = 1 if days_since_last > 180 else 0
-        
-        data.append({
-            'Customer_ID': f'CUST-{i+1000}',
-            'Signup_Date': signup_date,
-            'Total_Purchases': purchases,
-            'Avg_Order_Value': round(avg_order, 2),
-            'Lifetime_Value': round(lifetime_value, 2),
-            'Days_Since_Last_Purchase': days_since_last,
-            'Churned': churned,
-            'Satisfaction_Score': random.randint(1, 5),
-            'Support_Tickets': random.randint(0, 10),
-            'Segment': random.choice(['High Value', 'Medium Value', 'Low Value'])
-        })
-    
-    return pd.DataFrame(data)
+    signup_dates = np.datetime64('2020-01-01') + rng.integers(0, 1461, n).astype('timedelta64[D]')
+    purchases = rng.integers(1, 51, n)
+    avg_order = rng.uniform(50, 500, n)
+    lifetime_value = purchases * avg_order
+    
+    # churn logic
+    days_since_last = rng.integers(0, 366, n)
+    churned = (days_since_last > 180).astype(np.int8)
+    
+    df = pd.DataFrame({
+        'Customer_ID': np.char.add('CUST-', np.arange(1000, 1000 + n).astype(str)),
+        'Signup_Date': signup_dates,
+        'Total_Purchases': purchases.astype(np.int8),
+        'Avg_Order_Value': np.round(avg_order, 2),
+        'Lifetime_Value': np.round(lifetime_value, 2),
+        'Days_Since_Last_Purchase': days_since_last.astype(np.int16),
+        'Churned': churned,
+        'Satisfaction_Score': rng.integers(1, 6, n).astype(np.int8),
+        'Support_Tickets': rng.integers(0, 11, n).astype(np.int8),
+        'Segment': rng.choice(['High Value', 'Medium Value', 'Low Value'], n)
+    })
+    
+    df['Segment'] = df['Segment'].astype('category')
+    
+    return df
+
+
+# pyarrow encodes CSV on multiple threads, pandas to_csv is single-threaded
+def write_csv(df, path):
+    
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    
+    # all timestamps are whole days, keep them as plain dates in the file
+    for i, field in enumerate(table.schema):
+        if pa.types.is_timestamp(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.date32()))
+        # pyarrow writes whole-number floats as '0', pandas as '0.0'; keep the '.0'
+        elif pa.types.is_floating(field.type):
+            text = table.column(i).cast(pa.string())
+            whole = pc.match_substring_regex(text, r'^-?\d+$')
+            text = pc.if_else(whole, pc.binary_join_element_wise(text, '.0', ''), text)
+            table = table.set_column(i, field.name, text)
+    
+    # no generated field holds a comma or quote, so write header and values
+    # unquoted like pandas did; the header is written by hand because older
+    # pyarrow releases always quote column names
+    with open(path, 'wb') as f:
+        f.write((','.join(table.column_names) + '\n').encode())
+        pacsv.write_csv(table, f, write_options=pacsv.WriteOptions(include_header=False, quoting_style='none'))
 
 
 # Generate all datasets
-print("Creating sales data...")
-sales_df = generate_sales_data(5000)
-
-print("Creating operations data...")
-operations_df = generate_operations_data()
-
-print("Creating financial data...")
-financial_df = generate_financial_data()
-
-print("Creating customer data...")
-customer_df = generate_customer_data(1500)
-
-# Save to CSV
-sales_df.to_csv('superstore_sales.csv', index=False)
-operations_df.to_csv('operations_data.csv', index=False)
-financial_df.to_csv('financial_data.csv', index=False)
-customer_df.to_csv('customer_data.csv', index=False)
-
-print("\nDatasets created successfully!")
-print(f"Sales records: {len(sales_df)}")
-print(f"Operations records: {len(operations_df)}")
-print(f"Financial records: {len(financial_df)}")
-print(f"Customer records: {len(customer_df)}")
-print("\nFiles saved in current directory.")
\ No newline at end of file
+if __name__ == '__main__':
+    print("Generating datasets...")
+
+    print("Creating sales data...")
+    sales_df = generate_sales_data(5000)
+
+    print("Creating operations data...")
+    operations_df = generate_operations_data()
+
+    print("Creating financial data...")
+    financial_df = generate_financial_data()
+
+    print("Creating customer data...")
+    customer_df = generate_customer_data(1500)
+
+    # Save to CSV (human readable) and Parquet (typed, read by the chart scripts)
+    datasets = {
+        'superstore_sales': sales_df,
+        'operations_data': operations_df,
+        'financial_data': financial_df,
+        'customer_data': customer_df
+    }
+    for name, df in datasets.items():
+        write_csv(df, f'{name}.csv')
+        df.to_parquet(f'{name}.parquet', index=False)
+
+    print("\nDatasets created successfully!")
+    print(f"Sales records: {len(sales_df)}")
+    print(f"Operations records: {len(operations_df)}")
+    print(f"Financial records: {len(financial_df)}")
+    print(f"Customer records: {len(customer_df)}")
+    print("\nFiles saved in current directory.")
\ No newline at end of file
@@ -4,13 +4,9 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 
-sales = pd.read_csv('superstore_sales.csv')
-operations = pd.read_csv('operations_data.csv')
-financial = pd.read_csv('financial_data.csv')
-
-sales['Order_Date'] = pd.to_datetime(sales['Order_Date'])
-operations['Date'] = pd.to_datetime(operations['Date'])
-financial['Month'] = pd.to_datetime(financial['Month'])
+sales = pd.read_parquet('superstore_sales.parquet')
+operations = pd.read_parquet('operations_data.parquet')
+financial = pd.read_parquet('financial_data.parquet')
 
 print("Creating advanced visualizations...")
 
@@ -48,12 +44,7 @@ print("✓ Heatmap created")
 # 9. HEATMAP - Sales by region and category
 # ==========================================
 
-region_category = sales.pivot_table(
-    values='Sales',
-    index='Region',
-    columns='Category',
-    aggfunc='sum'
-)
+region_category = pd.read_parquet('region_category_pivot.parquet')
 
 fig9 = go.Figure(data=go.Heatmap(
     z=region_category.values,
@@ -82,7 +73,7 @@ print("✓ Geographic heatmap created")
 # 10. TREEMAP - Hierarchical sales
 # ==========================================
 
-treemap_data = sales.groupby(['Category', 'Sub_Category'])['Sales'].sum().reset_index()
+treemap_data = sales.groupby(['Category', 'Sub_Category'], observed=True)['Sales'].sum().reset_index()
 
 fig10 = px.treemap(
     treemap_data,
@@ -114,31 +105,27 @@ print("✓ Treemap created")
 # ==========================================
 
 # segment -> region -> category flow
-sankey_df = sales.groupby(['Segment', 'Region', 'Category'])['Sales'].sum().reset_index()
-
 # create nodes
 segments = sales['Segment'].unique().tolist()
 regions = sales['Region'].unique().tolist()
 categories = sales['Category'].unique().tolist()
 
 all_nodes = segments + regions + categories
-
-# create links
-source = []
-target = []
-value = []
-
-# segment to region
-for _, row in sales.groupby(['Segment', 'Region'])['Sales'].sum().reset_index().iterrows():
-    source.append(all_nodes.index(row['Segment']))
-    target.append(all_nodes.index(row['Region']))
-    value.append(row['Sales'])
-
-# region to category
-for _, row in sales.groupby(['Region', 'Category'])['Sales'].sum().reset_index().iterrows():
-    source.append(all_nodes.index(row['Region']))
-    target.append(all_nodes.index(row['Category']))
-    value.append(row['Sales'])
+node_index = {name: i for i, name in enumerate(all_nodes)}
+
+# create links: segment -> region, then region -> category
+seg_reg = sales.groupby(['Segment', 'Region'], observed=True)['Sales'].sum().reset_index()
+reg_cat = sales.groupby(['Region', 'Category'], observed=True)['Sales'].sum().reset_index()
+
+source = np.concatenate([
+    seg_reg['Segment'].map(node_index).to_numpy(dtype=int),
+    reg_cat['Region'].map(node_index).to_numpy(dtype=int)
+])
+target = np.concatenate([
+    seg_reg['Region'].map(node_index).to_numpy(dtype=int),
+    reg_cat['Category'].map(node_index).to_numpy(dtype=int)
+])
+value = np.concatenate([seg_reg['Sales'].to_numpy(), reg_cat['Sales'].to_numpy()])
 
 fig11 = go.Figure(data=[go.Sankey(
     node=dict(
@@ -173,7 +160,7 @@ print("✓ Sankey diagram created")
 # ==========================================
 
 # calculate metrics for each region
-region_metrics = sales.groupby('Region').agg({
+region_metrics = sales.groupby('Region', observed=True).agg({
     'Sales': 'sum',
     'Profit': 'sum',
     'Quantity': 'sum',
@@ -182,24 +169,16 @@ region_metrics = sales.groupby('Region').agg({
 
 region_metrics.columns = ['Region', 'Sales', 'Profit', 'Quantity', 'Orders']
 
+categories = ['Sales', 'Profit', 'Quantity', 'Orders']
+colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A']
+
 # normalize to 0-100 scale for better comparison
-for col in ['Sales', 'Profit', 'Quantity', 'Orders']:
-    max_val = region_metrics[col].max()
-    region_metrics[col + '_norm'] = (region_metrics[col] / max_val) * 100
+region_scores = region_metrics.set_index('Region')[categories]
+region_scores = region_scores.div(region_scores.max()) * 100
 
 fig12 = go.Figure()
 
-categories = ['Sales', 'Profit', 'Quantity', 'Orders']
-colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A']
-
-for i, region in enumerate(region_metrics['Region']):
-    values = [
-        region_metrics[region_metrics['Region'] == region]['Sales_norm'].values[0],
-        region_metrics[region_metrics['Region'] == region]['Profit_norm'].values[0],
-        region_metrics[region_metrics['Region'] == region]['Quantity_norm'].values[0],
-        region_metrics[region_metrics['Region'] == region]['Orders_norm'].values[0]
-    ]
-    
+for i, (region, values) in enumerate(zip(region_scores.index, region_scores.to_numpy().tolist())):
     fig12.add_trace(go.Scatterpolar(
         r=values + [values[0]],
         theta=categories + [categories[0]],
@@ -277,20 +256,12 @@ print("✓ Waterfall chart created")
 financial['Year'] = financial['Month'].dt.year
 yearly = financial.groupby('Year')['Net_Profit'].sum().reset_index()
 
-waterfall_yearly = []
-labels_yearly = []
-
-for i in range(len(yearly)):
-    if i == 0:
-        waterfall_yearly.append(yearly.iloc[i]['Net_Profit'])
-        labels_yearly.append(str(yearly.iloc[i]['Year']))
-    else:
-        change = yearly.iloc[i]['Net_Profit'] - yearly.iloc[i-1]['Net_Profit']
-        waterfall_yearly.append(change)
-        labels_yearly.append(f"{yearly.iloc[i]['Year']} Change")
+# opening year, year-over-year changes, then the closing total
+profits = yearly['Net_Profit'].to_numpy()
+years = yearly['Year'].to_numpy()
 
-waterfall_yearly.append(yearly.iloc[-1]['Net_Profit'])
-labels_yearly.append('Final 2024')
+waterfall_yearly = np.concatenate([[profits[0]], np.diff(profits), [profits[-1]]])
+labels_yearly = [str(years[0])] + [f'{year} Change' for year in years[1:]] + ['Final 2024']
 
 measures = ['absolute'] + ['relative'] * (len(waterfall_yearly) - 2) + ['total']
 
@@ -322,12 +293,7 @@ print("✓ Yearly waterfall created")
 # 15. COMBO CHART - Multiple viz types
 # ==========================================
 
-monthly_perf = sales.groupby(sales['Order_Date'].dt.to_period('M')).agg({
-    'Sales': 'sum',
-    'Profit': 'sum',
-    'Order_ID': 'count'
-}).reset_index()
-monthly_perf['Order_Date'] = monthly_perf['Order_Date'].apply(lambda x: x.to_timestamp())
+monthly_perf = pd.read_parquet('monthly_sales.parquet')
 monthly_perf['Profit_Margin'] = (monthly_perf['Profit'] / monthly_perf['Sales']) * 100
 
 fig15 = make_subplots(specs=[[{"secondary_y": True}]])
@@ -6,14 +6,9 @@ import numpy as np
 from scipy import stats
 
 # Load data
-sales = pd.read_csv('superstore_sales.csv')
-operations = pd.read_csv('operations_data.csv')
-financial = pd.read_csv('financial_data.csv')
-
-# convert dates
-sales['Order_Date'] = pd.to_datetime(sales['Order_Date'])
-operations['Date'] = pd.to_datetime(operations['Date'])
-financial['Month'] = pd.to_datetime(financial['Month'])
+sales = pd.read_parquet('superstore_sales.parquet')
+operations = pd.read_parquet('operations_data.parquet')
+financial = pd.read_parquet('financial_data.parquet')
 
 print("Creating statistical visualizations...")
 
@@ -22,8 +17,7 @@ print("Creating statistical visualizations...")
 # ==========================================
 
 # monthly sales over time
-monthly_sales = sales.groupby(sales['Order_Date'].dt.to_period('M'))['Sales'].sum().reset_index()
-monthly_sales['Order_Date'] = monthly_sales['Order_Date'].apply(lambda x: x.to_timestamp())
+monthly_sales = pd.read_parquet('monthly_sales.parquet')
 
 fig1 = go.Figure()
 
@@ -66,30 +60,26 @@ print("✓ Line chart created")
 # 2. BAR CHART - Category comparisons
 # ==========================================
 
-category_sales = sales.groupby('Category').agg({
-    'Sales': 'sum',
-    'Profit': 'sum',
-    'Quantity': 'sum'
-}).reset_index()
+category_sales = pd.read_parquet('category_summary.parquet')
 
 fig2 = go.Figure()
 
 fig2.add_trace(go.Bar(
     x=category_sales['Category'],
-    y=category_sales['Sales'],
+    y=category_sales['Sales_sum'],
     name='Sales',
     marker_color='#A23B72',
-    text=category_sales['Sales'].apply(lambda x: f'${x:,.0f}'),
+    texttemplate='$%{y:,.0f}',
     textposition='outside',
     hovertemplate='<b>%{x}</b><br>Sales: $%{y:,.0f}<extra></extra>'
 ))
 
 fig2.add_trace(go.Bar(
     x=category_sales['Category'],
-    y=category_sales['Profit'],
+    y=category_sales['Profit_sum'],
     name='Profit',
     marker_color='#F18F01',
-    text=category_sales['Profit'].apply(lambda x: f'${x:,.0f}'),
+    texttemplate='$%{y:,.0f}',
     textposition='outside',
     hovertemplate='<b>%{x}</b><br>Profit: $%{y:,.0f}<extra></extra>'
 ))
@@ -170,9 +160,11 @@ y = sales['Profit']
 z = np.polyfit(x, y, 1)
 p = np.poly1d(z)
 
+xs = np.sort(x.to_numpy())
+
 fig4.add_trace(go.Scatter(
-    x=sorted(x),
-    y=p(sorted(x)),
+    x=xs,
+    y=p(xs),
     mode='lines',
     name='Trend Line',
     line=dict(color='red', dash='dash', width=2),
@@ -238,8 +230,8 @@ print("✓ Box plot created")
 monthly_category = sales.groupby([
     sales['Order_Date'].dt.to_period('M'), 
     'Category'
-])['Sales'].sum().reset_index()
-monthly_category['Order_Date'] = monthly_category['Order_Date'].apply(lambda x: x.to_timestamp())
+], observed=True)['Sales'].sum().reset_index()
+monthly_category['Order_Date'] = monthly_category['Order_Date'].dt.to_timestamp()
 
 fig6 = px.line(
     monthly_category,
@@ -267,7 +259,7 @@ print("✓ Multi-series line chart created")
 # 7. STACKED BAR CHART
 # ==========================================
 
-segment_region = sales.groupby(['Region', 'Segment'])['Sales'].sum().reset_index()
+segment_region = sales.groupby(['Region', 'Segment'], observed=True)['Sales'].sum().reset_index()
 
 fig7 = px.bar(
     segment_region,
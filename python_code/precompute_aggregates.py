@@ -0,0 +1,62 @@
+import pandas as pd
+
+# Shared aggregations used by the chart scripts. Run once after
+# data_generation.py; the chart scripts read the cached parquet files
+# instead of re-grouping the raw sales data on every run.
+
+sales = pd.read_parquet('superstore_sales.parquet')
+
+print("Precomputing shared aggregates...")
+
+# ==========================================
+# MONTHLY SALES - fig1, fig15
+# ==========================================
+
+monthly_sales = sales.groupby(sales['Order_Date'].dt.to_period('M')).agg(
+    Sales=('Sales', 'sum'),
+    Profit=('Profit', 'sum'),
+    Orders=('Order_ID', 'count')
+).reset_index()
+monthly_sales['Order_Date'] = monthly_sales['Order_Date'].dt.to_timestamp()
+
+monthly_sales.to_parquet('monthly_sales.parquet', index=False)
+print("✓ Monthly sales cached")
+
+
+# ==========================================
+# CATEGORY SUMMARY - fig2, summary table (16)
+# ==========================================
+
+by_cat = sales.groupby('Category', observed=True).agg(
+    Sales_sum=('Sales', 'sum'),
+    Sales_mean=('Sales', 'mean'),
+    Orders=('Order_ID', 'count'),
+    Profit_sum=('Profit', 'sum'),
+    Profit_mean=('Profit', 'mean'),
+    Qty_sum=('Quantity', 'sum'),
+    Discount_mean=('Discount', 'mean')
+).reset_index()
+
+by_cat.to_parquet('category_summary.parquet', index=False)
+print("✓ Category summary cached")
+
+
+# ==========================================
+# REGION x CATEGORY PIVOT - fig9
+# ==========================================
+
+region_category = sales.pivot_table(
+    values='Sales',
+    index='Region',
+    columns='Category',
+    aggfunc='sum',
+    observed=True
+)
+# parquet needs string column labels
+region_category.columns = region_category.columns.astype(str)
+
+region_category.to_parquet('region_category_pivot.parquet')
+print("✓ Region x category pivot cached")
+
+
+print("\n=== Aggregates Complete ===")
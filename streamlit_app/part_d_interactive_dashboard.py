@@ -1,10 +1,11 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
 
+# plotly.express and plotly.subplots are imported inside the views that use
+# them, so a session that never opens those views never pays for loading them
+
 # page config
 st.set_page_config(
     page_title="Sales Analytics Dashboard",
@@ -13,27 +14,139 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# load data with caching
-@st.cache_data
+# load data with caching; cache_resource hands every rerun the same frame
+# instead of unpickling a copy, so it must never be modified in place
+@st.cache_resource
 def load_data():
-    sales = pd.read_csv('superstore_sales.csv')
-    sales['Order_Date'] = pd.to_datetime(sales['Order_Date'])
-    sales['Year'] = sales['Order_Date'].dt.year
-    sales['Month'] = sales['Order_Date'].dt.month
-    sales['Quarter'] = sales['Order_Date'].dt.quarter
-    sales['Month_Name'] = sales['Order_Date'].dt.strftime('%b %Y')
-    
-    operations = pd.read_csv('operations_data.csv')
-    operations['Date'] = pd.to_datetime(operations['Date'])
-    
-    financial = pd.read_csv('financial_data.csv')
-    financial['Month'] = pd.to_datetime(financial['Month'])
+    # pyarrow parses the CSV on multiple threads and converts the dates while reading;
+    # the dashboard only reads the sales table, so the other datasets are not loaded
+    sales = pd.read_csv(
+        'superstore_sales.csv',
+        engine='pyarrow',
+        parse_dates=['Order_Date', 'Ship_Date'],
+        # narrow numeric types halve the bytes every scan and sum touches
+        dtype={'Sales': 'float32', 'Profit': 'float32', 'Discount': 'float32', 'Quantity': 'int8'}
+    )
+    # date parts from the month count since 1970, plain integer math in numpy
+    month_idx = sales['Order_Date'].to_numpy().astype('datetime64[M]').astype(np.int64)
+    sales['Year'] = (month_idx // 12 + 1970).astype(np.int16)
+    sales['Month'] = (month_idx % 12 + 1).astype(np.int8)
+    sales['Quarter'] = ((sales['Month'] - 1) // 3 + 1).astype(np.int8)
+    
+    # month labels ordered by date rather than alphabetically,
+    # each label formatted once and looked up by month offset
+    months = pd.period_range(sales['Order_Date'].min(), sales['Order_Date'].max(), freq='M')
+    sales['Month_Name'] = pd.Categorical.from_codes(
+        month_idx - month_idx.min(),
+        categories=months.strftime('%b %Y'),
+        ordered=True
+    )
     
-    customer = pd.read_csv('customer_data.csv')
+    # low-cardinality labels as categoricals so groupbys work on integer codes
+    for col in ['Region', 'Category', 'Sub_Category', 'Segment', 'State']:
+        sales[col] = sales[col].astype('category')
+    
+    # sidebar options, computed once instead of scanning the columns every rerun
+    meta = {
+        'regions': sorted(sales['Region'].unique().tolist()),
+        'categories': sorted(sales['Category'].unique().tolist()),
+        'segments': sales['Segment'].unique().tolist(),
+        'min_date': sales['Order_Date'].min(),
+        'max_date': sales['Order_Date'].max()
+    }
     
-    return sales, operations, financial, customer
+    return sales, meta
+
+base_sales, meta = load_data()
+
+# per-filter aggregations, cached on the sidebar filter key; the filtered
+# frame is passed as _sales so Streamlit does not hash it on every rerun.
+# the cache is shared by all sessions and every date range is a new key,
+# so each function keeps only the most recent filter combinations
+FILTER_CACHE_ENTRIES = 128
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def monthly_trend(key, _sales):
+    return _sales.groupby('Month_Name', observed=True).agg({
+        'Sales': 'sum',
+        'Profit': 'sum'
+    }).reset_index()
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def agg_by_category(key, _sales):
+    return _sales.groupby('Category', observed=True)['Sales'].sum().reset_index()
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def regional_perf(key, _sales):
+    region_data = _sales.groupby('Region', observed=True).agg({
+        'Sales': 'sum',
+        'Profit': 'sum'
+    }).reset_index()
+    region_data['Profit_Margin'] = (region_data['Profit'] / region_data['Sales'] * 100)
+    return region_data
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def segment_perf(key, _sales):
+    return _sales.groupby('Segment', observed=True).agg({
+        'Sales': 'sum',
+        'Profit': 'sum'
+    }).reset_index()
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def top_products(key, _sales):
+    return _sales.groupby('Product_Name', sort=False)['Sales'].sum().nlargest(10).reset_index()
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def subcat_perf(key, _sales):
+    return _sales.groupby('Sub_Category', observed=True).agg({
+        'Sales': 'sum',
+        'Profit': 'sum'
+    }).reset_index()
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def quarterly_trend(key, _sales):
+    quarterly = _sales.groupby(['Year', 'Quarter']).agg({
+        'Sales': 'sum',
+        'Profit': 'sum'
+    }).reset_index()
+    quarterly['Period'] = quarterly['Year'].astype(str) + '-Q' + quarterly['Quarter'].astype(str)
+    return quarterly
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def profit_heatmap(key, _sales):
+    return _sales.pivot_table(
+        values='Profit',
+        index='Category',
+        columns='Region',
+        aggfunc='sum',
+        observed=True
+    )
 
-sales, operations, financial, customer = load_data()
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def subcat_breakdown(key, category, _sales):
+    # select the rows and only the summed columns in one step before grouping
+    rows = _sales.loc[_sales['Category'] == category, ['Sub_Category', 'Sales', 'Profit', 'Quantity']]
+    return rows.groupby('Sub_Category', observed=True).sum().reset_index()
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def state_breakdown(key, region, _sales):
+    state_data = _sales[_sales['Region'] == region].groupby('State', observed=True, sort=False)['Sales'].sum().reset_index()
+    # top 10 in ascending order so the largest bar is drawn at the top
+    return state_data.nlargest(10, 'Sales').iloc[::-1]
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def scenario_base(key, _sales):
+    # one reduction over both columns, accumulated in float64 so the
+    # float32 columns do not round the totals
+    base_sales, base_profit = _sales[['Sales', 'Profit']].to_numpy().sum(axis=0, dtype=np.float64)
+    return float(base_sales), float(base_profit)
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def agg_kpi(key, _sales):
+    # sales and profit in one float64 pass like scenario_base; Order_ID has
+    # no missing values, so pd.unique gives the count without nunique's NaN handling
+    total_sales, total_profit = _sales[['Sales', 'Profit']].to_numpy().sum(axis=0, dtype=np.float64)
+    total_orders = len(pd.unique(_sales['Order_ID'].to_numpy()))
+    return float(total_sales), float(total_profit), total_orders
 
 # custom CSS
 st.markdown("""
@@ -64,8 +177,8 @@ st.markdown("""
 st.sidebar.header("Filters & Controls")
 
 # date range filter
-min_date = sales['Order_Date'].min()
-max_date = sales['Order_Date'].max()
+min_date = meta['min_date']
+max_date = meta['max_date']
 
 date_range = st.sidebar.date_input(
     "Select Date Range",
@@ -74,33 +187,45 @@ date_range = st.sidebar.date_input(
     max_value=max_date
 )
 
-if len(date_range) == 2:
-    start_date, end_date = date_range
-    sales = sales[(sales['Order_Date'] >= pd.to_datetime(start_date)) & 
-                  (sales['Order_Date'] <= pd.to_datetime(end_date))]
-
 # region filter
-regions = ['All'] + sorted(sales['Region'].unique().tolist())
+regions = ['All'] + meta['regions']
 selected_region = st.sidebar.selectbox("Select Region", regions)
 
-if selected_region != 'All':
-    sales = sales[sales['Region'] == selected_region]
-
 # category filter
-categories = ['All'] + sorted(sales['Category'].unique().tolist())
+categories = ['All'] + meta['categories']
 selected_category = st.sidebar.selectbox("Select Category", categories)
 
-if selected_category != 'All':
-    sales = sales[sales['Category'] == selected_category]
-
 # segment filter
 segments = st.sidebar.multiselect(
     "Select Segments",
-    options=sales['Segment'].unique(),
-    default=sales['Segment'].unique()
+    options=meta['segments'],
+    default=meta['segments']
 )
 
-sales = sales[sales['Segment'].isin(segments)]
+if len(date_range) == 2:
+    start_date, end_date = date_range
+else:
+    start_date = end_date = None
+
+# combine the active filters into one mask so the frame is sliced once
+mask = np.ones(len(base_sales), dtype=bool)
+
+if start_date is not None:
+    mask &= base_sales['Order_Date'].between(pd.to_datetime(start_date), pd.to_datetime(end_date)).to_numpy()
+
+if selected_region != 'All':
+    mask &= (base_sales['Region'] == selected_region).to_numpy()
+
+if selected_category != 'All':
+    mask &= (base_sales['Category'] == selected_category).to_numpy()
+
+mask &= base_sales['Segment'].isin(segments).to_numpy()
+
+# filtered view used by every chart below; base_sales stays untouched
+sales = base_sales.loc[mask]
+
+# cache key for the aggregations above
+filter_key = (start_date, end_date, selected_region, selected_category, tuple(sorted(segments)))
 
 st.sidebar.markdown("---")
 
@@ -132,12 +257,13 @@ st.markdown("### Self-Service Business Intelligence Platform")
 
 if view_mode == "Executive Summary":
     
+    import plotly.express as px
+    from plotly.subplots import make_subplots
+    
     # KPI metrics row
     col1, col2, col3, col4 = st.columns(4)
     
-    total_sales = sales['Sales'].sum()
-    total_profit = sales['Profit'].sum()
-    total_orders = sales['Order_ID'].nunique()
+    total_sales, total_profit, total_orders = agg_kpi(filter_key, sales)
     avg_order = total_sales / total_orders if total_orders > 0 else 0
     
     with col1:
@@ -177,10 +303,7 @@ if view_mode == "Executive Summary":
     with col1:
         st.subheader("Sales & Profit Trend")
         
-        monthly = sales.groupby('Month_Name').agg({
-            'Sales': 'sum',
-            'Profit': 'sum'
-        }).reset_index()
+        monthly = monthly_trend(filter_key, sales)
         
         fig = make_subplots(specs=[[{"secondary_y": True}]])
         
@@ -216,7 +339,7 @@ if view_mode == "Executive Summary":
     with col2:
         st.subheader("Category Split")
         
-        category_data = sales.groupby('Category')['Sales'].sum().reset_index()
+        category_data = agg_by_category(filter_key, sales)
         
         fig = px.pie(
             category_data,
@@ -243,12 +366,7 @@ if view_mode == "Executive Summary":
     with col1:
         st.subheader("Regional Performance")
         
-        region_data = sales.groupby('Region').agg({
-            'Sales': 'sum',
-            'Profit': 'sum'
-        }).reset_index()
-        
-        region_data['Profit_Margin'] = (region_data['Profit'] / region_data['Sales'] * 100)
+        region_data = regional_perf(filter_key, sales)
         
         fig = go.Figure()
         
@@ -257,7 +375,8 @@ if view_mode == "Executive Summary":
             y=region_data['Sales'],
             name='Sales',
             marker_color='#3498db',
-            text=region_data['Sales'].apply(lambda x: f'${x/1000:.0f}K'),
+            text=region_data['Sales'] / 1000,
+            texttemplate='$%{text:.0f}K',
             textposition='outside'
         ))
         
@@ -272,11 +391,7 @@ if view_mode == "Executive Summary":
     with col2:
         st.subheader("Segment Analysis")
         
-        segment_data = sales.groupby('Segment').agg({
-            'Sales': 'sum',
-            'Profit': 'sum',
-            'Order_ID': 'nunique'
-        }).reset_index()
+        segment_data = segment_perf(filter_key, sales)
         
         fig = px.bar(
             segment_data,
@@ -302,6 +417,8 @@ if view_mode == "Executive Summary":
 
 elif view_mode == "Detailed Analysis":
     
+    import plotly.express as px
+    
     st.subheader("Detailed Performance Analysis")
     
     tab1, tab2, tab3 = st.tabs(["Product Analysis", "Time Analysis", "Profitability"])
@@ -312,10 +429,10 @@ elif view_mode == "Detailed Analysis":
         with col1:
             st.markdown("#### Top 10 Products by Sales")
             
-            top_products = sales.groupby('Product_Name')['Sales'].sum().nlargest(10).reset_index()
+            top_data = top_products(filter_key, sales)
             
             fig = px.bar(
-                top_products,
+                top_data,
                 y='Product_Name',
                 x='Sales',
                 orientation='h',
@@ -329,10 +446,7 @@ elif view_mode == "Detailed Analysis":
         with col2:
             st.markdown("#### Sub-Category Performance")
             
-            subcat = sales.groupby('Sub_Category').agg({
-                'Sales': 'sum',
-                'Profit': 'sum'
-            }).reset_index()
+            subcat = subcat_perf(filter_key, sales)
             
             fig = px.scatter(
                 subcat,
@@ -350,13 +464,7 @@ elif view_mode == "Detailed Analysis":
     with tab2:
         st.markdown("#### Quarterly Trends")
         
-        quarterly = sales.groupby(['Year', 'Quarter']).agg({
-            'Sales': 'sum',
-            'Profit': 'sum',
-            'Order_ID': 'nunique'
-        }).reset_index()
-        
-        quarterly['Period'] = quarterly['Year'].astype(str) + '-Q' + quarterly['Quarter'].astype(str)
+        quarterly = quarterly_trend(filter_key, sales)
         
         fig = go.Figure()
         
@@ -386,12 +494,7 @@ elif view_mode == "Detailed Analysis":
     with tab3:
         st.markdown("#### Profitability Heatmap")
         
-        heatmap_data = sales.pivot_table(
-            values='Profit',
-            index='Category',
-            columns='Region',
-            aggfunc='sum'
-        )
+        heatmap_data = profit_heatmap(filter_key, sales)
         
         fig = go.Figure(data=go.Heatmap(
             z=heatmap_data.values,
@@ -412,6 +515,8 @@ elif view_mode == "Detailed Analysis":
 
 elif view_mode == "Drill-Down Explorer":
     
+    import plotly.express as px
+    
     st.subheader("Interactive Drill-Down Explorer")
     
     st.info("Click on any chart element to drill down into details!")
@@ -430,7 +535,7 @@ elif view_mode == "Drill-Down Explorer":
         with col1:
             st.markdown("#### Step 1: Select Category")
             
-            cat_sales = sales.groupby('Category')['Sales'].sum().reset_index()
+            cat_sales = agg_by_category(filter_key, sales)
             
             selected_cat = st.selectbox(
                 "Choose a category to drill down:",
@@ -451,12 +556,7 @@ elif view_mode == "Drill-Down Explorer":
         with col2:
             st.markdown(f"#### Step 2: {selected_cat} - Sub-Categories")
             
-            filtered = sales[sales['Category'] == selected_cat]
-            subcat_data = filtered.groupby('Sub_Category').agg({
-                'Sales': 'sum',
-                'Profit': 'sum',
-                'Quantity': 'sum'
-            }).reset_index()
+            subcat_data = subcat_breakdown(filter_key, selected_cat, sales)
             
             fig = px.treemap(
                 subcat_data,
@@ -473,11 +573,15 @@ elif view_mode == "Drill-Down Explorer":
         # detailed table
         st.markdown("#### Step 3: Detailed Transactions")
         
+        filtered = sales[sales['Category'] == selected_cat]
         detail_data = filtered[['Order_ID', 'Order_Date', 'Sub_Category', 
-                               'Product_Name', 'Sales', 'Profit', 'Quantity']].sort_values('Sales', ascending=False)
+                               'Product_Name', 'Sales', 'Profit', 'Quantity']].nlargest(20, 'Sales')
+        # the grid shows raw values, widen the float32 money columns back to the
+        # two-decimal amounts in the CSV instead of showing float32 noise
+        detail_data = detail_data.astype({'Sales': 'float64', 'Profit': 'float64'}).round({'Sales': 2, 'Profit': 2})
         
         st.dataframe(
-            detail_data.head(20),
+            detail_data,
             use_container_width=True,
             hide_index=True
         )
@@ -489,7 +593,7 @@ elif view_mode == "Drill-Down Explorer":
         with col1:
             st.markdown("#### Regional Overview")
             
-            region_sales = sales.groupby('Region')['Sales'].sum().reset_index()
+            region_sales = regional_perf(filter_key, sales)
             
             selected_region = st.selectbox(
                 "Select Region:",
@@ -509,8 +613,7 @@ elif view_mode == "Drill-Down Explorer":
         with col2:
             st.markdown(f"#### {selected_region} - State Breakdown")
             
-            state_data = sales[sales['Region'] == selected_region].groupby('State')['Sales'].sum().reset_index()
-            state_data = state_data.sort_values('Sales', ascending=True).tail(10)
+            state_data = state_breakdown(filter_key, selected_region, sales)
             
             fig = px.bar(
                 state_data,
@@ -564,8 +667,7 @@ elif view_mode == "What-If Scenario":
         )
     
     # calculate scenarios
-    base_sales = sales['Sales'].sum()
-    base_profit = sales['Profit'].sum()
+    base_sales, base_profit = scenario_base(filter_key, sales)
     base_cost = base_sales - base_profit
     
     new_price_mult = 1 + (price_change / 100)
@@ -600,7 +702,7 @@ elif view_mode == "What-If Scenario":
     
     with col3:
         margin = (new_profit / new_sales * 100) if new_sales > 0 else 0
-        base_margin = (base_profit / base_sales * 100)
+        base_margin = (base_profit / base_sales * 100) if base_sales > 0 else 0
         margin_delta = margin - base_margin
         st.metric(
             "Profit Margin",
@@ -608,37 +710,37 @@ elif view_mode == "What-If Scenario":
             delta=f"{margin_delta:.1f}%"
         )
     
-    # comparison chart
-    comparison_df = pd.DataFrame({
-        'Scenario': ['Current', 'Projected'],
-        'Sales': [base_sales, new_sales],
-        'Profit': [base_profit, new_profit]
-    })
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Bar(
-        x=comparison_df['Scenario'],
-        y=comparison_df['Sales'],
-        name='Sales',
-        marker_color='lightblue'
-    ))
-    
-    fig.add_trace(go.Bar(
-        x=comparison_df['Scenario'],
-        y=comparison_df['Profit'],
-        name='Profit',
-        marker_color='lightgreen'
-    ))
-    
-    fig.update_layout(
-        height=400,
-        barmode='group',
-        template='plotly_white',
-        title='Current vs Projected Performance'
-    )
+    # comparison chart, built once per session; slider reruns only swap in
+    # the new bar heights instead of constructing and validating a new figure
+    if 'whatif_fig' not in st.session_state:
+        fig = go.Figure()
+        
+        fig.add_trace(go.Bar(
+            x=['Current', 'Projected'],
+            name='Sales',
+            marker_color='lightblue'
+        ))
+        
+        fig.add_trace(go.Bar(
+            x=['Current', 'Projected'],
+            name='Profit',
+            marker_color='lightgreen'
+        ))
+        
+        fig.update_layout(
+            height=400,
+            barmode='group',
+            template='plotly_white',
+            title='Current vs Projected Performance'
+        )
+        
+        st.session_state['whatif_fig'] = fig
+    
+    fig = st.session_state['whatif_fig']
+    fig.data[0].y = [base_sales, new_sales]
+    fig.data[1].y = [base_profit, new_profit]
     
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, key='whatif_chart')
 
 # footer
 st.markdown("---")